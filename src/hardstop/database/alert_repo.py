@@ -77,8 +77,18 @@ def get_first_seen_provenance(
     if not root_event_ids:
         return None, None
 
+    # Select only the columns compared below so raw payloads and event JSON are not loaded.
+    # Earliest-wins stays in Python: timestamps may carry different UTC offsets.
     rows = (
-        session.query(Event, RawItem)
+        session.query(
+            Event.source_id,
+            Event.event_time_utc,
+            RawItem.raw_id,
+            RawItem.source_id,
+            RawItem.tier,
+            RawItem.fetched_at_utc,
+            RawItem.published_at_utc,
+        )
         .outerjoin(RawItem, Event.raw_id == RawItem.raw_id)
         .filter(Event.event_id.in_(root_event_ids))
         .all()
@@ -89,22 +99,21 @@ def get_first_seen_provenance(
     best_seen_at = None
     best_source_id = None
     best_tier = None
-    for event_row, raw_row in rows:
+    for event_source_id, event_time_utc, raw_id, raw_source_id, raw_tier, fetched_at_utc, published_at_utc in rows:
+        has_raw = raw_id is not None
         seen_at = None
-        if raw_row:
-            seen_at = raw_row.fetched_at_utc or raw_row.published_at_utc
-            if not seen_at:
-                seen_at = None
+        if has_raw:
+            seen_at = fetched_at_utc or published_at_utc
         if not seen_at:
-            seen_at = event_row.event_time_utc
+            seen_at = event_time_utc
 
         if not seen_at:
             continue
 
         if best_seen_at is None or _is_timestamp_before(seen_at, best_seen_at):
             best_seen_at = seen_at
-            best_source_id = raw_row.source_id if raw_row else event_row.source_id
-            best_tier = raw_row.tier if raw_row else None
+            best_source_id = raw_source_id if has_raw else event_source_id
+            best_tier = raw_tier if has_raw else None
 
     if best_seen_at is None:
         return None, None
@@ -2,9 +2,9 @@
 
 import json
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session
 
 from hardstop.database.schema import RawItem
 from hardstop.retrieval.dedupe import compute_content_hash, get_dedupe_key
@@ -102,29 +102,16 @@ def save_raw_item(
     return raw_item
 
 
-def get_raw_items_for_ingest(
-    session: Session,
-    limit: Optional[int] = None,
-    min_tier: Optional[str] = None,
-    source_id: Optional[str] = None,
-    since_hours: Optional[int] = None,
-    include_suppressed: bool = False,
-) -> List[RawItem]:
-    """
-    Get raw items with NEW status for ingestion.
-    
-    Args:
-        session: SQLAlchemy session
-        limit: Maximum number of items to return
-        min_tier: Minimum tier (global > regional > local). None = all tiers.
-        source_id: Filter by specific source ID. None = all sources.
-        since_hours: Only get items fetched within this many hours. None = all.
-        include_suppressed: Whether to include suppressed items (default False)
-        
-    Returns:
-        List of RawItem rows
-    """
-    query = session.query(RawItem).filter(RawItem.status == "NEW")
+def _filter_for_ingest(
+    query: Query,
+    limit: Optional[int],
+    min_tier: Optional[str],
+    source_id: Optional[str],
+    since_hours: Optional[int],
+    include_suppressed: bool,
+) -> Query:
+    """Apply the ingest queue filters and ordering to a RawItem query."""
+    query = query.filter(RawItem.status == "NEW")
     
     # Filter out suppressed items by default (v0.8)
     if not include_suppressed:
@@ -160,9 +147,90 @@ def get_raw_items_for_ingest(
     if limit:
         query = query.limit(limit)
     
+    return query
+
+
+def get_raw_items_for_ingest(
+    session: Session,
+    limit: Optional[int] = None,
+    min_tier: Optional[str] = None,
+    source_id: Optional[str] = None,
+    since_hours: Optional[int] = None,
+    include_suppressed: bool = False,
+) -> List[RawItem]:
+    """
+    Get raw items with NEW status for ingestion.
+    
+    Loads every matching row at once. Kept for tests and ad-hoc use; the ingest
+    runner streams instead via get_raw_item_keys_for_ingest and iter_raw_items_by_ids.
+    
+    Args:
+        session: SQLAlchemy session
+        limit: Maximum number of items to return
+        min_tier: Minimum tier (global > regional > local). None = all tiers.
+        source_id: Filter by specific source ID. None = all sources.
+        since_hours: Only get items fetched within this many hours. None = all.
+        include_suppressed: Whether to include suppressed items (default False)
+        
+    Returns:
+        List of RawItem rows
+    """
+    query = _filter_for_ingest(
+        session.query(RawItem), limit, min_tier, source_id, since_hours, include_suppressed
+    )
     return query.all()
 
 
+def get_raw_item_keys_for_ingest(
+    session: Session,
+    limit: Optional[int] = None,
+    min_tier: Optional[str] = None,
+    source_id: Optional[str] = None,
+    since_hours: Optional[int] = None,
+    include_suppressed: bool = False,
+) -> List[Tuple[str, str]]:
+    """
+    Get (raw_id, source_id) keys for the ingest queue without loading payloads.
+    
+    Same filters and ordering as get_raw_items_for_ingest(). Pair with
+    iter_raw_items_by_ids() to load full rows in bounded batches.
+    
+    Returns:
+        List of (raw_id, source_id) tuples, oldest first
+    """
+    query = _filter_for_ingest(
+        session.query(RawItem.raw_id, RawItem.source_id),
+        limit,
+        min_tier,
+        source_id,
+        since_hours,
+        include_suppressed,
+    )
+    return [(row.raw_id, row.source_id) for row in query]
+
+
+def iter_raw_items_by_ids(
+    session: Session,
+    raw_ids: Sequence[str],
+    batch_size: int = 200,
+) -> Iterator[RawItem]:
+    """
+    Yield RawItem rows for raw_ids in the given order, loading batch_size rows at a time.
+    
+    Only one batch of rows (including raw_payload_json) is held at once, so peak
+    memory is bounded by batch_size rather than the queue length. IDs that no
+    longer exist are skipped.
+    """
+    for start in range(0, len(raw_ids), batch_size):
+        batch_ids = raw_ids[start:start + batch_size]
+        rows = session.query(RawItem).filter(RawItem.raw_id.in_(batch_ids)).all()
+        rows_by_id = {row.raw_id: row for row in rows}
+        for raw_id in batch_ids:
+            row = rows_by_id.get(raw_id)
+            if row is not None:
+                yield row
+
+
 def mark_raw_item_status(
     session: Session,
     raw_id: str,
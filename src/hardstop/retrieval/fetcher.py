@@ -16,6 +16,31 @@ from hardstop.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+def _parse_per_tier_min_seconds(value: object) -> Dict[str, float]:
+    """
+    Validate rate_limit.per_tier_min_seconds into a tier -> seconds mapping.
+    
+    Anything other than a mapping (e.g. a bare number) disables per-tier limiting
+    with a warning instead of failing every fetch; non-numeric entries are skipped.
+    """
+    if value is None:
+        return {}
+    if not isinstance(value, dict):
+        logger.warning(
+            "Ignoring rate_limit.per_tier_min_seconds: expected a mapping of tier to seconds, got %r",
+            value,
+        )
+        return {}
+    
+    per_tier: Dict[str, float] = {}
+    for tier, seconds in value.items():
+        try:
+            per_tier[str(tier)] = float(seconds)
+        except (TypeError, ValueError):
+            logger.warning("Ignoring rate_limit.per_tier_min_seconds.%s: not a number (%r)", tier, seconds)
+    return per_tier
+
+
 class FetchResult(BaseModel):
     """Result of fetching from a source (v0.9)."""
     
@@ -53,6 +78,9 @@ class SourceFetcher:
         self.defaults = sources_config.get("defaults", {})
         self.rate_limit_config = self.defaults.get("rate_limit", {})
         self.per_host_min_seconds = self.rate_limit_config.get("per_host_min_seconds", 2)
+        self.per_tier_min_seconds = _parse_per_tier_min_seconds(
+            self.rate_limit_config.get("per_tier_min_seconds")
+        )
         configured_jitter = self.rate_limit_config.get("jitter_seconds", 1)
         self.strict = strict
         self.jitter_seconds = 0 if strict else configured_jitter
@@ -60,30 +88,47 @@ class SourceFetcher:
         self._rng = random.Random(self.random_seed)
         self._adapter_versions: Set[str] = set()
         
-        # Track last fetch time per host
+        # Track last fetch time per host and per tier
         self._last_fetch_time: Dict[str, float] = {}
+        self._last_tier_fetch_time: Dict[str, float] = {}
     
     def _get_host_from_url(self, url: str) -> str:
         """Extract host from URL for rate limiting."""
         parsed = urlparse(url)
         return parsed.netloc or parsed.path.split("/")[0]
     
-    def _wait_for_rate_limit(self, url: str) -> None:
-        """Wait if necessary to respect rate limit for this host."""
+    def _wait_for_rate_limit(self, url: str, tier: Optional[str] = None) -> None:
+        """
+        Wait if necessary to respect rate limits for this host and tier.
+        
+        The per-host interval spaces requests to the same host; the optional
+        per-tier interval caps aggregate request rate across all hosts in a tier.
+        When both apply, the longer of the two waits wins.
+        """
         host = self._get_host_from_url(url)
-        last_time = self._last_fetch_time.get(host, 0)
         now = time.time()
-        elapsed = now - last_time
-        min_interval = self.per_host_min_seconds
+        wait_time = 0.0
+        
+        if self.per_host_min_seconds > 0:
+            elapsed = now - self._last_fetch_time.get(host, 0)
+            wait_time = max(wait_time, self.per_host_min_seconds - elapsed)
+        
+        tier_min_seconds = self.per_tier_min_seconds.get(tier, 0) if tier else 0
+        if tier_min_seconds > 0:
+            elapsed = now - self._last_tier_fetch_time.get(tier, 0)
+            wait_time = max(wait_time, tier_min_seconds - elapsed)
         
-        if elapsed < min_interval:
-            wait_time = min_interval - elapsed
+        # Jitter is only added to an actual wait, so no wait means no RNG draw
+        if wait_time > 0:
             jitter = self._rng.uniform(0, self.jitter_seconds) if self.jitter_seconds > 0 else 0
             total_wait = wait_time + jitter
-            logger.debug("Rate limiting: waiting %.2fs for host %s", total_wait, host)
+            logger.debug("Rate limiting: waiting %.2fs for host %s (tier %s)", total_wait, host, tier)
             time.sleep(total_wait)
+            now = time.time()
         
-        self._last_fetch_time[host] = time.time()
+        self._last_fetch_time[host] = now
+        if tier:
+            self._last_tier_fetch_time[tier] = now
 
     def best_effort_metadata(self) -> Dict:
         """Return best-effort metadata for RunRecord compatibility."""
@@ -181,7 +226,7 @@ class SourceFetcher:
             
             try:
                 # Rate limiting
-                self._wait_for_rate_limit(source_url)
+                self._wait_for_rate_limit(source_url, source.get("tier"))
                 
                 # Create adapter
                 adapter = create_adapter(source, self.defaults, random_seed=self.random_seed)
@@ -312,7 +357,7 @@ class SourceFetcher:
         
         try:
             # Rate limiting
-            self._wait_for_rate_limit(source_url)
+            self._wait_for_rate_limit(source_url, source.get("tier"))
             
             # Create adapter
             adapter = create_adapter(source, self.defaults, random_seed=self.random_seed)
@@ -19,7 +19,8 @@ from hardstop.config.loader import (
 )
 from hardstop.database.event_repo import save_event
 from hardstop.database.raw_item_repo import (
-    get_raw_items_for_ingest,
+    get_raw_item_keys_for_ingest,
+    iter_raw_items_by_ids,
     mark_raw_item_status,
     mark_raw_item_suppressed,
 )
@@ -32,6 +33,14 @@ from hardstop.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Error strings are persisted to raw_items/source_runs; keep them bounded
+MAX_ERROR_CHARS = 1000
+
+
+def _format_error(exc: BaseException) -> str:
+    """Format an exception as a compact "Type: message" string for persistence."""
+    return f"{type(exc).__name__}: {exc}"[:MAX_ERROR_CHARS]
+
 
 def preflight_source_batch(source_id: str, source_items: List) -> None:
     """
@@ -45,7 +54,7 @@ def preflight_source_batch(source_id: str, source_items: List) -> None:
     
     Args:
         source_id: Source ID being processed
-        source_items: List of raw items for this source
+        source_items: Raw item IDs queued for this source
         
     Raises:
         ValueError: If source_id is empty or source_items is None
@@ -60,6 +69,17 @@ def preflight_source_batch(source_id: str, source_items: List) -> None:
     # Note: We don't validate list/tuple type to avoid breaking weird adapters
 
 
+def _parse_source_rules(source_id: str, source_config: Dict[str, Any]) -> List[SuppressionRule]:
+    """Convert a source's suppress entries to SuppressionRule models, skipping invalid ones."""
+    source_rules: List[SuppressionRule] = []
+    for rule_dict in get_suppression_rules_for_source(source_config):
+        try:
+            source_rules.append(SuppressionRule(**rule_dict))
+        except Exception as e:
+            logger.warning("Invalid source suppression rule for %s: %s", source_id, e)
+    return source_rules
+
+
 def main(
     session: Session,
     limit: Optional[int] = None,
@@ -123,8 +143,8 @@ def main(
         except Exception as e:
             logger.warning("Error loading suppression config: %s", e)
     
-    # Get raw items for ingestion
-    raw_items = get_raw_items_for_ingest(
+    # Get raw item keys for ingestion; full rows (with payloads) are loaded in batches below
+    raw_item_keys = get_raw_item_keys_for_ingest(
         session=session,
         limit=limit,
         min_tier=min_tier,
@@ -132,16 +152,19 @@ def main(
         since_hours=since_hours,
     )
     
-    logger.info("Processing %s raw items for ingestion", len(raw_items))
+    logger.info("Processing %s raw items for ingestion", len(raw_item_keys))
     
-    # Group raw items by source_id (v0.9)
-    items_by_source: Dict[str, List] = defaultdict(list)
-    for raw_item in raw_items:
-        items_by_source[raw_item.source_id].append(raw_item)
+    # Group raw item IDs by source_id (v0.9)
+    items_by_source: Dict[str, List[str]] = defaultdict(list)
+    for raw_id, item_source_id in raw_item_keys:
+        items_by_source[item_source_id].append(raw_id)
     
     # Note: Sources with 0 items to ingest will have empty list in items_by_source
     # We still write INGEST SourceRun for them (v1.0: explicit "ingest skipped")
     
+    # Parsed source-specific suppression rules, keyed by source_id
+    source_rules_cache: Dict[str, List[SuppressionRule]] = {}
+    
     stats = {
         "processed": 0,
         "events": 0,
@@ -219,7 +242,7 @@ def main(
             # Preflight checks (provides stable seam for batch-level failure injection)
             preflight_source_batch(source_id, source_items)
             
-            for raw_item in source_items:
+            for raw_item in iter_raw_items_by_ids(session, source_items):
                 try:
                     # Parse raw payload
                     payload = json.loads(raw_item.raw_payload_json)
@@ -248,16 +271,16 @@ def main(
                     
                     # Evaluate suppression (v0.8)
                     suppressed = False
+                    source_rules: List[SuppressionRule] = []
                     if not no_suppress:
-                        # Get source-specific suppression rules
-                        source_rules: List[SuppressionRule] = []
-                        source_suppress_rules = get_suppression_rules_for_source(source_config)
-                        for rule_dict in source_suppress_rules:
-                            try:
-                                source_rules.append(SuppressionRule(**rule_dict))
-                            except Exception as e:
-                                logger.warning("Invalid source suppression rule for %s: %s", raw_item.source_id, e)
-                        
+                        # Get source-specific suppression rules (parsed once per source)
+                        source_rules = source_rules_cache.get(raw_item.source_id)
+                        if source_rules is None:
+                            source_rules = _parse_source_rules(raw_item.source_id, source_config)
+                            source_rules_cache[raw_item.source_id] = source_rules
+                    
+                    # Skip evaluation entirely when no rules are configured (common case)
+                    if not no_suppress and (global_rules or source_rules):
                         # Evaluate suppression
                         suppression_result = evaluate_suppression(
                             source_id=raw_item.source_id,
@@ -336,7 +359,7 @@ def main(
                     stats["processed"] += 1
                     
                 except Exception as e:
-                    error_msg = str(e)
+                    error_msg = _format_error(e)
                     logger.error("Failed to process raw_item %s: %s", raw_item.raw_id, error_msg, exc_info=True)
                     try:
                         session.rollback()  # Rollback failed transaction
@@ -351,9 +374,8 @@ def main(
                     stats["errors"] += 1
                     source_processed += 1
                     stats["processed"] += 1
-                    truncated_error = error_msg[:1000] if error_msg else None
                     if source_error_msg is None:
-                        source_error_msg = truncated_error
+                        source_error_msg = error_msg
                     if fail_fast:
                         ingest_status = "FAILURE"
                         duration_seconds = time.monotonic() - source_start_time
@@ -367,10 +389,11 @@ def main(
         except Exception as batch_error:
             # Source batch failed catastrophically (v1.0)
             ingest_status = "FAILURE"
-            error_msg = str(batch_error)
-            # Truncate error to 1000 chars for database safety
-            source_error_msg = error_msg[:1000] if len(error_msg) > 1000 else error_msg
-            logger.error("Source batch %s failed: %s", source_id, error_msg, exc_info=True)
+            if source_run_written:
+                # Item-level fail_fast already logged and recorded this error
+                raise
+            source_error_msg = _format_error(batch_error)
+            logger.error("Source batch %s failed: %s", source_id, source_error_msg, exc_info=True)
             
             # Calculate duration immediately (before potentially re-raising)
             source_duration = time.monotonic() - source_start_time
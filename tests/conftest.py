@@ -1,8 +1,17 @@
 """Pytest configuration and fixtures."""
 
+import copy
+import functools
+import hashlib
+import json
+import mmap
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
 
 from hardstop.database.migrate import (
     ensure_alert_correlation_columns,
@@ -13,25 +22,171 @@ from hardstop.database.migrate import (
     ensure_trust_tier_columns,
 )
 from hardstop.database.schema import Base
+from hardstop.ingestion.file_ingestor import ingest_all_csvs
+from hardstop.runners import ingest_external
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+ADAPTER_FIXTURES_DIR = FIXTURES_DIR / "adapters"
+ADAPTER_FIXTURE_NAMES = ("rss_feed.xml", "nws_alerts.json", "fema_feed.json", "fema_feed.xml")
+RUN_RECORD_SCHEMA_PATH = Path(__file__).parent.parent / "docs" / "specs" / "run-record.schema.json"
+
+
+@pytest.fixture(scope="session")
+def adapter_fixtures():
+    """Raw bytes of the adapter fixture files, read once per test session."""
+    return {name: (ADAPTER_FIXTURES_DIR / name).read_bytes() for name in ADAPTER_FIXTURE_NAMES}
+
+
+def _sha256_file(path):
+    """Hash a file through a read-only memory map instead of a bytes copy."""
+    with open(path, "rb") as f:
+        # mmap rejects zero-length files; an emptied fixture should still fail as a hash mismatch
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256(b"", usedforsecurity=False).hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped, usedforsecurity=False).hexdigest()
+
+
+@pytest.fixture(scope="session")
+def golden_fixture_digest():
+    """
+    Return a lookup from fixture file name to its SHA-256 hex digest.
+    
+    Each file is hashed on first request and cached for the session, so a
+    missing or broken fixture only fails the tests that ask for it.
+    """
+    @functools.cache
+    def digest(name):
+        return _sha256_file(FIXTURES_DIR / name)
+    
+    return digest
+
+
+@pytest.fixture(scope="session")
+def spill_event_source():
+    """Parsed event_spill.json, shared across the session. Do not mutate; use raw_spill_event."""
+    return json.loads((FIXTURES_DIR / "event_spill.json").read_text(encoding="utf-8"))
 
 
 @pytest.fixture
-def session():
-    """Create a temporary in-memory database session for testing."""
-    # Create in-memory SQLite database
+def raw_spill_event(spill_event_source):
+    """Fresh copy of event_spill.json that a test may mutate freely."""
+    return copy.deepcopy(spill_event_source)
+
+
+@pytest.fixture(scope="session")
+def normalized_spill_event():
+    """Parsed normalized_event_spill.json, shared across the session (read-only)."""
+    return json.loads((FIXTURES_DIR / "normalized_event_spill.json").read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="session")
+def incident_evidence_spill():
+    """Parsed incident_evidence_spill.json, shared across the session (read-only)."""
+    return json.loads((FIXTURES_DIR / "incident_evidence_spill.json").read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="session")
+def run_record_schema():
+    """Parsed run-record JSON schema, shared across the session (read-only)."""
+    return json.loads(RUN_RECORD_SCHEMA_PATH.read_text(encoding="utf-8"))
+
+
+def _create_savepoint_engine():
+    """
+    In-memory SQLite engine whose transactions can be rolled back around a test.
+    
+    pysqlite's own transaction handling breaks SAVEPOINT, so BEGIN is emitted
+    explicitly (the recipe from the SQLAlchemy SQLite dialect docs).
+    """
     engine = create_engine("sqlite:///:memory:", echo=False)
+
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, _connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture(scope="module")
+def network_engine():
+    """Engine with the demo network CSVs ingested once per test module."""
+    engine = _create_savepoint_engine()
+    with Session(engine) as setup_session:
+        ingest_all_csvs(
+            FIXTURES_DIR / "facilities.csv",
+            FIXTURES_DIR / "lanes.csv",
+            FIXTURES_DIR / "shipments_snapshot.csv",
+            setup_session,
+        )
+    yield engine
+    engine.dispose()
+
+
+@contextmanager
+def _rolled_back_session(engine):
+    """
+    Yield a session whose work is rolled back on exit.
     
-    # Run migrations
-    # Note: We can't use the migration functions directly with in-memory DB,
-    # but since we're creating all tables from schema, columns should exist.
-    # For tests that need migrations, we can add columns manually if needed.
-    
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
-    
+    Commits inside the test only release a SAVEPOINT; the outer transaction
+    is rolled back afterwards, so the next test sees the engine's data unchanged.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
     try:
         yield session
     finally:
         session.close()
+        transaction.rollback()
+        connection.close()
+
 
+@pytest.fixture(scope="session")
+def db_engine():
+    """Empty in-memory schema, created once per test session."""
+    engine = _create_savepoint_engine()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(db_engine):
+    """Database session for a test, isolated by rolling back its transaction."""
+    with _rolled_back_session(db_engine) as test_session:
+        yield test_session
+
+
+@pytest.fixture
+def ingested_session(network_engine):
+    """Session over the pre-ingested demo network, rolled back after each test."""
+    with _rolled_back_session(network_engine) as test_session:
+        yield test_session
+
+
+@pytest.fixture
+def ingest_output_dirs(tmp_path, monkeypatch):
+    """
+    Redirect ingest_external's run records and incident artifacts under tmp_path.
+    
+    Their defaults are relative to the working directory, so an unredirected
+    ingest run writes into the repository's run_records/ and output/incidents/.
+    """
+    records_dir = tmp_path / "run_records"
+    incidents_dir = tmp_path / "incidents"
+    monkeypatch.setattr(
+        ingest_external,
+        "normalize_external_event",
+        functools.partial(ingest_external.normalize_external_event, dest_dir=str(records_dir)),
+    )
+    monkeypatch.setattr(
+        ingest_external,
+        "build_basic_alert",
+        functools.partial(ingest_external.build_basic_alert, incident_dest_dir=incidents_dir),
+    )
+    return records_dir, incidents_dir
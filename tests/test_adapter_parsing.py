@@ -1,4 +1,3 @@
-from pathlib import Path
 import json
 
 import requests
@@ -6,9 +5,6 @@ import requests
 from hardstop.retrieval.adapters import FEMAAdapter, NWSAlertsAdapter, RSSAdapter
 
 
-FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures" / "adapters"
-
-
 class DummyResponse:
     def __init__(self, *, content: bytes, status_code: int = 200, headers: dict | None = None, json_data=None):
         self.content = content
@@ -39,8 +35,8 @@ def _defaults() -> dict:
     return {"timeout_seconds": 5, "user_agent": "hardstop-test/1.0"}
 
 
-def test_rss_adapter_parsing(monkeypatch):
-    fixture = (FIXTURE_DIR / "rss_feed.xml").read_bytes()
+def test_rss_adapter_parsing(monkeypatch, adapter_fixtures):
+    fixture = adapter_fixtures["rss_feed.xml"]
 
     def fake_get(*_args, **_kwargs):
         return DummyResponse(content=fixture, headers={"Content-Type": "application/rss+xml"})
@@ -58,12 +54,13 @@ def test_rss_adapter_parsing(monkeypatch):
     assert response.items[0].published_at_utc == "2024-01-01T12:00:00+00:00"
 
 
-def test_nws_adapter_parsing(monkeypatch):
-    fixture = json.loads((FIXTURE_DIR / "nws_alerts.json").read_text(encoding="utf-8"))
+def test_nws_adapter_parsing(monkeypatch, adapter_fixtures):
+    fixture_bytes = adapter_fixtures["nws_alerts.json"]
+    fixture = json.loads(fixture_bytes)
 
     def fake_get(*_args, **_kwargs):
         return DummyResponse(
-            content=json.dumps(fixture).encode("utf-8"),
+            content=fixture_bytes,
             headers={"Content-Type": "application/geo+json"},
             json_data=fixture,
         )
@@ -82,8 +79,8 @@ def test_nws_adapter_parsing(monkeypatch):
     assert item.published_at_utc == "2024-01-15T17:00:00+00:00"
 
 
-def test_fema_adapter_parses_rss(monkeypatch):
-    fixture = (FIXTURE_DIR / "fema_feed.xml").read_bytes()
+def test_fema_adapter_parses_rss(monkeypatch, adapter_fixtures):
+    fixture = adapter_fixtures["fema_feed.xml"]
 
     def fake_get(*_args, **_kwargs):
         return DummyResponse(content=fixture, headers={"Content-Type": "application/rss+xml"})
@@ -102,13 +99,13 @@ def test_fema_adapter_parses_rss(monkeypatch):
     assert item.published_at_utc == "2024-01-03T14:00:00+00:00"
 
 
-def test_fema_adapter_parses_json(monkeypatch):
-    fixture_text = (FIXTURE_DIR / "fema_feed.json").read_text(encoding="utf-8")
-    fixture = json.loads(fixture_text)
+def test_fema_adapter_parses_json(monkeypatch, adapter_fixtures):
+    fixture_bytes = adapter_fixtures["fema_feed.json"]
+    fixture = json.loads(fixture_bytes)
 
     def fake_get(*_args, **_kwargs):
         return DummyResponse(
-            content=fixture_text.encode("utf-8"),
+            content=fixture_bytes,
             headers={"Content-Type": "application/json"},
             json_data=fixture,
         )
@@ -2,15 +2,12 @@
 
 import json
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
 
 import pytest
 import requests
 
 from hardstop.retrieval.adapters import FEMAAdapter, NWSAlertsAdapter, RSSAdapter
 
-FIXTURES_DIR = Path(__file__).parent / "fixtures" / "adapters"
-
 
 def _build_response(*, content: bytes, status_code: int = 200, headers: dict | None = None) -> requests.Response:
     response = requests.Response()
@@ -38,8 +35,8 @@ def _default_defaults() -> dict:
     }
 
 
-def test_rss_adapter_parses_feed(mocker):
-    content = (FIXTURES_DIR / "rss_feed.xml").read_bytes()
+def test_rss_adapter_parses_feed(mocker, adapter_fixtures):
+    content = adapter_fixtures["rss_feed.xml"]
     response = _build_response(content=content, headers={"Content-Type": "application/rss+xml"})
     mocker.patch("requests.get", return_value=response)
 
@@ -55,8 +52,8 @@ def test_rss_adapter_parses_feed(mocker):
     assert first.payload["summary"] == "First alert summary."
 
 
-def test_nws_adapter_parses_geojson(mocker):
-    content = (FIXTURES_DIR / "nws_alerts.json").read_bytes()
+def test_nws_adapter_parses_geojson(mocker, adapter_fixtures):
+    content = adapter_fixtures["nws_alerts.json"]
     response = _build_response(content=content, headers={"Content-Type": "application/geo+json"})
     mocker.patch("requests.get", return_value=response)
 
@@ -73,8 +70,8 @@ def test_nws_adapter_parses_geojson(mocker):
     assert item.payload["geometry"]["type"] == "Point"
 
 
-def test_fema_adapter_parses_json(mocker):
-    content = (FIXTURES_DIR / "fema_feed.json").read_bytes()
+def test_fema_adapter_parses_json(mocker, adapter_fixtures):
+    content = adapter_fixtures["fema_feed.json"]
     response = _build_response(content=content, headers={"Content-Type": "application/json"})
     mocker.patch("requests.get", return_value=response)
 
@@ -129,8 +126,8 @@ def test_fema_adapter_json_since_filter_skips_old_items(mocker):
     assert result.items[0].published_at_utc == payload["items"][1]["sent"]
 
 
-def test_fema_adapter_parses_rss(mocker):
-    content = (FIXTURES_DIR / "fema_feed.xml").read_bytes()
+def test_fema_adapter_parses_rss(mocker, adapter_fixtures):
+    content = adapter_fixtures["fema_feed.xml"]
     response = _build_response(content=content, headers={"Content-Type": "application/rss+xml"})
     mocker.patch("requests.get", return_value=response)
 
@@ -165,8 +162,8 @@ def test_fema_adapter_invalid_json_raises_decode_error(mocker):
         adapter.fetch()
 
 
-def test_rss_adapter_parse_failure_raises_runtime_error(mocker):
-    content = (FIXTURES_DIR / "rss_feed.xml").read_bytes()
+def test_rss_adapter_parse_failure_raises_runtime_error(mocker, adapter_fixtures):
+    content = adapter_fixtures["rss_feed.xml"]
     response = _build_response(content=content, headers={"Content-Type": "application/rss+xml"})
     mocker.patch("requests.get", return_value=response)
     mocker.patch("feedparser.parse", side_effect=ValueError("bad feed"))
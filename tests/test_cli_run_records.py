@@ -26,11 +26,10 @@ def _instrument_run_record(tmp_path, monkeypatch):
     return records_dir
 
 
-def _load_validated_record(records_dir: Path) -> dict:
+def _load_validated_record(records_dir: Path, schema: dict) -> dict:
     files = sorted(records_dir.glob("*.json"))
     assert files, "expected run record to be written"
     data = json.loads(files[-1].read_text(encoding="utf-8"))
-    schema = json.loads(Path("docs/specs/run-record.schema.json").read_text(encoding="utf-8"))
     jsonschema.validate(instance=data, schema=schema)
     return data
 
@@ -57,7 +56,7 @@ def _stub_noops(monkeypatch):
                 monkeypatch.setattr(mod, name, lambda *_, **__: None)
 
 
-def test_cmd_fetch_emits_run_record_success(monkeypatch, tmp_path):
+def test_cmd_fetch_emits_run_record_success(monkeypatch, tmp_path, run_record_schema):
     records_dir = _instrument_run_record(tmp_path, monkeypatch)
     _stub_config(monkeypatch, tmp_path)
     _stub_noops(monkeypatch)
@@ -106,7 +105,7 @@ def test_cmd_fetch_emits_run_record_success(monkeypatch, tmp_path):
     )
     pipeline_mod.cmd_fetch(args, run_group_id="group-fetch")
 
-    data = _load_validated_record(records_dir)
+    data = _load_validated_record(records_dir, run_record_schema)
     assert data["operator_id"] == "hardstop.fetch@1.0.0"
     assert not data["errors"]
     assert any(ref["id"] == "run-group:group-fetch" for ref in data["input_refs"])
@@ -114,7 +113,7 @@ def test_cmd_fetch_emits_run_record_success(monkeypatch, tmp_path):
     assert data["best_effort"]["seed"] == 7
 
 
-def test_cmd_fetch_emits_run_record_on_failure(monkeypatch, tmp_path):
+def test_cmd_fetch_emits_run_record_on_failure(monkeypatch, tmp_path, run_record_schema):
     records_dir = _instrument_run_record(tmp_path, monkeypatch)
     _stub_config(monkeypatch, tmp_path)
     _stub_noops(monkeypatch)
@@ -146,12 +145,12 @@ def test_cmd_fetch_emits_run_record_on_failure(monkeypatch, tmp_path):
     with pytest.raises(RuntimeError):
         pipeline_mod.cmd_fetch(args, run_group_id="group-fetch-fail")
 
-    data = _load_validated_record(records_dir)
+    data = _load_validated_record(records_dir, run_record_schema)
     assert data["operator_id"] == "hardstop.fetch@1.0.0"
     assert data["errors"]
 
 
-def test_cmd_ingest_emits_run_record_success(monkeypatch, tmp_path):
+def test_cmd_ingest_emits_run_record_success(monkeypatch, tmp_path, run_record_schema):
     records_dir = _instrument_run_record(tmp_path, monkeypatch)
     _stub_config(monkeypatch, tmp_path)
     _stub_noops(monkeypatch)
@@ -176,13 +175,13 @@ def test_cmd_ingest_emits_run_record_success(monkeypatch, tmp_path):
     )
     pipeline_mod.cmd_ingest_external(args, run_group_id="group-ingest")
 
-    data = _load_validated_record(records_dir)
+    data = _load_validated_record(records_dir, run_record_schema)
     assert data["operator_id"] == "hardstop.ingest@1.0.0"
     assert data["mode"] == "strict"
     assert any(ref["kind"] == "SourceRun" for ref in data["output_refs"])
 
 
-def test_cmd_ingest_emits_run_record_on_failure(monkeypatch, tmp_path):
+def test_cmd_ingest_emits_run_record_on_failure(monkeypatch, tmp_path, run_record_schema):
     records_dir = _instrument_run_record(tmp_path, monkeypatch)
     _stub_config(monkeypatch, tmp_path)
     _stub_noops(monkeypatch)
@@ -206,12 +205,12 @@ def test_cmd_ingest_emits_run_record_on_failure(monkeypatch, tmp_path):
     with pytest.raises(RuntimeError):
         pipeline_mod.cmd_ingest_external(args, run_group_id="group-ingest-fail")
 
-    data = _load_validated_record(records_dir)
+    data = _load_validated_record(records_dir, run_record_schema)
     assert data["operator_id"] == "hardstop.ingest@1.0.0"
     assert data["errors"]
 
 
-def test_cmd_brief_emits_run_record_success(monkeypatch, tmp_path):
+def test_cmd_brief_emits_run_record_success(monkeypatch, tmp_path, run_record_schema):
     records_dir = _instrument_run_record(tmp_path, monkeypatch)
     _stub_config(monkeypatch, tmp_path)
     _stub_noops(monkeypatch)
@@ -229,7 +228,7 @@ def test_cmd_brief_emits_run_record_success(monkeypatch, tmp_path):
     )
     output_mod.cmd_brief(args, run_group_id="group-brief")
 
-    data = _load_validated_record(records_dir)
+    data = _load_validated_record(records_dir, run_record_schema)
     assert data["operator_id"] == "hardstop.brief@1.0.0"
     assert not data["errors"]
     assert any(ref["kind"] == "Brief" for ref in data["output_refs"])
@@ -237,7 +236,7 @@ def test_cmd_brief_emits_run_record_success(monkeypatch, tmp_path):
     assert any(ref["hash"] == expected_hash for ref in data["output_refs"])
 
 
-def test_cmd_brief_emits_run_record_on_failure(monkeypatch, tmp_path):
+def test_cmd_brief_emits_run_record_on_failure(monkeypatch, tmp_path, run_record_schema):
     records_dir = _instrument_run_record(tmp_path, monkeypatch)
     _stub_config(monkeypatch, tmp_path)
     _stub_noops(monkeypatch)
@@ -260,7 +259,7 @@ def test_cmd_brief_emits_run_record_on_failure(monkeypatch, tmp_path):
     with pytest.raises(RuntimeError):
         output_mod.cmd_brief(args, run_group_id="group-brief-fail")
 
-    data = _load_validated_record(records_dir)
+    data = _load_validated_record(records_dir, run_record_schema)
     assert data["operator_id"] == "hardstop.brief@1.0.0"
     assert data["errors"]
 
@@ -2,9 +2,10 @@
 
 import hashlib
 import json
-from pathlib import Path
 from types import SimpleNamespace
 
+import pytest
+
 from hardstop.alerts.alert_builder import build_basic_alert
 from hardstop.alerts.correlation import build_correlation_key
 from hardstop.database.schema import Alert, Facility
@@ -33,27 +34,23 @@ def test_build_correlation_key_stable():
     assert "LANE-001" in k1
 
 
-def test_correlation_key_risk_bucket():
+@pytest.mark.parametrize(
+    ("event", "prefix"),
+    [
+        # Explicit event_type
+        ({"event_type": "SPILL", "facilities": ["PLANT-01"], "lanes": []}, "SPILL|"),
+        # Keyword inference
+        ({"title": "Chemical spill", "raw_text": "spill occurred", "facilities": ["PLANT-01"], "lanes": []}, "SPILL|"),
+        # Strike
+        ({"event_type": "STRIKE", "facilities": ["PLANT-01"], "lanes": []}, "STRIKE|"),
+        # Closure
+        ({"title": "Facility shutdown", "facilities": ["PLANT-01"], "lanes": []}, "CLOSURE|"),
+    ],
+    ids=["explicit-spill", "inferred-spill", "strike", "closure"],
+)
+def test_correlation_key_risk_bucket(event, prefix):
     """Test that risk buckets are correctly identified."""
-    # Test explicit event_type
-    event1 = {"event_type": "SPILL", "facilities": ["PLANT-01"], "lanes": []}
-    key1 = build_correlation_key(event1)
-    assert key1.startswith("SPILL|")
-    
-    # Test keyword inference
-    event2 = {"title": "Chemical spill", "raw_text": "spill occurred", "facilities": ["PLANT-01"], "lanes": []}
-    key2 = build_correlation_key(event2)
-    assert key2.startswith("SPILL|")
-    
-    # Test strike
-    event3 = {"event_type": "STRIKE", "facilities": ["PLANT-01"], "lanes": []}
-    key3 = build_correlation_key(event3)
-    assert key3.startswith("STRIKE|")
-    
-    # Test closure
-    event4 = {"title": "Facility shutdown", "facilities": ["PLANT-01"], "lanes": []}
-    key4 = build_correlation_key(event4)
-    assert key4.startswith("CLOSURE|")
+    assert build_correlation_key(event).startswith(prefix)
 
 
 def test_correlation_key_facility_lane():
@@ -111,9 +108,9 @@ def test_correlation_key_deduplicates_facilities():
     assert key1 == key2
 
 
-def test_canonical_payload_hash_matches_fixture(tmp_path):
-    raw = json.loads(Path("tests/fixtures/event_spill.json").read_text(encoding="utf-8"))
-    fixture = json.loads(Path("tests/fixtures/normalized_event_spill.json").read_text(encoding="utf-8"))
+def test_canonical_payload_hash_matches_fixture(tmp_path, raw_spill_event, normalized_spill_event):
+    raw = raw_spill_event
+    fixture = normalized_spill_event
     operator = CanonicalizeExternalEventOperator(
         mode="strict", config_snapshot={}, dest_dir=tmp_path, canonicalize_time=None
     )
@@ -150,7 +147,7 @@ def test_entity_link_partial_data_fallback(tmp_path):
     assert build_correlation_key(enriched).startswith("SPILL|NONE|NONE")
 
 
-def test_incident_evidence_artifact_matches_fixture(tmp_path):
+def test_incident_evidence_artifact_matches_fixture(tmp_path, incident_evidence_spill):
     event = {
         "event_id": "EVT-TEST-001",
         "title": "Chemical spill at DC-01",
@@ -178,7 +175,7 @@ def test_incident_evidence_artifact_matches_fixture(tmp_path):
         filename_basename="ALERT-XYZ__EVT-TEST-001__SPILL_DC-01_LANE-1",
     )
 
-    expected = json.loads(Path("tests/fixtures/incident_evidence_spill.json").read_text(encoding="utf-8"))
+    expected = incident_evidence_spill
     assert artifact.to_dict() == expected
     assert artifact_ref.hash == expected["artifact_hash"]
     assert artifact_path.exists()
@@ -1,9 +1,13 @@
+import copy
 import json
-from datetime import UTC
+import re
+import string
+from datetime import UTC, datetime
 from pathlib import Path
 
+import pytest
+
 from hardstop.alerts.alert_builder import build_basic_alert
-from hardstop.ingestion.file_ingestor import ingest_all_csvs
 from hardstop.parsing.entity_extractor import attach_dummy_entities
 from hardstop.parsing.network_linker import link_event_to_network
 from hardstop.parsing.normalizer import normalize_event
@@ -14,10 +18,96 @@ from hardstop.runners.run_demo import (
 )
 from hardstop.utils.id_generator import deterministic_id_context
 
+PINNED_ISO = DEFAULT_PINNED_TIMESTAMP.astimezone(UTC).isoformat().replace("+00:00", "Z")
+PINNED_DETERMINISM_CONTEXT = {
+    "seed": DEFAULT_PINNED_SEED,
+    "timestamp_utc": PINNED_ISO,
+    "run_id": DEFAULT_PINNED_RUN_ID,
+}
+
+# Windows drive-letter or Unix absolute path prefixes
+_ABS_PATH_PREFIXES = tuple(f"{letter}:\\" for letter in string.ascii_letters) + ("/",)
+_UUID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE)
+# UUID-bearing strings that are known to come from the deterministic context
+_DETERMINISTIC_ID_MARKER_RE = re.compile(r"demo|pinned", re.IGNORECASE)
+
+# Enough to make a failure message useful; the assertion only needs one
+_MAX_VIOLATIONS = 5
+
+
+def _format_path(parts):
+    """Render a path tuple like ("alert", "scope", 0) as "alert.scope[0]"."""
+    rendered = ""
+    for part in parts:
+        if isinstance(part, int):
+            rendered += f"[{part}]"
+        else:
+            rendered += f".{part}" if rendered else str(part)
+    return rendered
+
+
+def _find_nondeterministic(root, root_name, max_violations=_MAX_VIOLATIONS):
+    """
+    Walk a payload iteratively and collect nondeterministic-looking values.
+    
+    Paths are kept as tuples and only rendered when a violation is recorded.
+    Stops after max_violations findings.
+    """
+    violations = []
+    stack = [(root, (root_name,))]
+    while stack:
+        obj, parts = stack.pop()
+        if isinstance(obj, dict):
+            stack.extend((value, parts + (key,)) for key, value in obj.items())
+        elif isinstance(obj, list):
+            stack.extend((item, parts + (i,)) for i, item in enumerate(obj))
+        elif isinstance(obj, str):
+            # Check for absolute paths (Windows and Unix)
+            if obj.startswith(_ABS_PATH_PREFIXES):
+                path = _format_path(parts)
+                # Allow expected paths in incident artifacts
+                if "artifact_path" not in path and "incidents" not in obj.lower():
+                    violations.append(f"{path}: absolute path '{obj}'")
+            
+            # Check for random UUIDs (not from deterministic context)
+            if _UUID_RE.search(obj):
+                # Allow deterministic IDs (ALERT- format or known patterns)
+                if not (obj.startswith("ALERT-") or _DETERMINISTIC_ID_MARKER_RE.search(obj)):
+                    violations.append(f"{_format_path(parts)}: potential random UUID '{obj}'")
+        elif isinstance(obj, datetime):
+            # datetime objects should be timezone-aware in determinism_mode="pinned"
+            if obj.tzinfo is None:
+                violations.append(f"{_format_path(parts)}: naive datetime '{obj}'")
+        
+        if len(violations) >= max_violations:
+            break
+    return violations
+
+
+def _link_pinned_event(session, raw):
+    """Normalize and link a raw event, then pin its timestamps like the pinned demo."""
+    event = normalize_event(raw)
+    event = link_event_to_network(event, session=session)
+    event["event_time_utc"] = PINNED_ISO
+    event["published_at_utc"] = PINNED_ISO
+    event["scoring_now"] = DEFAULT_PINNED_TIMESTAMP
+    return event
+
+
+def _build_pinned_alert(session, event, incidents_dir):
+    """Build an alert from a pinned, linked event the way the pinned demo does."""
+    with deterministic_id_context(now=DEFAULT_PINNED_TIMESTAMP, seed=DEFAULT_PINNED_SEED):
+        return build_basic_alert(
+            event,
+            session=session,
+            determinism_mode="pinned",
+            determinism_context=dict(PINNED_DETERMINISM_CONTEXT),
+            incident_dest_dir=incidents_dir,
+        )
+
 
-def test_demo_pipeline():
-    event_path = Path("tests/fixtures/event_spill.json")
-    raw = json.loads(event_path.read_text(encoding="utf-8"))
+def test_demo_pipeline(raw_spill_event):
+    raw = raw_spill_event
     raw["event_id"] = "EVT-TEST-0001"
 
     event = normalize_event(raw)
@@ -30,40 +120,10 @@ def test_demo_pipeline():
     assert alert.scope.facilities
 
 
-def test_pinned_demo_output_is_stable(tmp_path, session):
-    facilities = Path("tests/fixtures/facilities.csv")
-    lanes = Path("tests/fixtures/lanes.csv")
-    shipments = Path("tests/fixtures/shipments_snapshot.csv")
-    ingest_all_csvs(facilities, lanes, shipments, session)
-
-    event_path = Path("tests/fixtures/event_spill.json")
-    raw = json.loads(event_path.read_text(encoding="utf-8"))
-    raw["event_id"] = "EVT-DEMO-0001"
-
-    event = normalize_event(raw)
-    event = link_event_to_network(event, session=session)
-
-    pinned_dt = DEFAULT_PINNED_TIMESTAMP
-    pinned_iso = pinned_dt.astimezone(UTC).isoformat().replace("+00:00", "Z")
-    event["event_time_utc"] = pinned_iso
-    event["published_at_utc"] = pinned_iso
-    event["scoring_now"] = pinned_dt
-
-    determinism_context = {
-        "seed": DEFAULT_PINNED_SEED,
-        "timestamp_utc": pinned_iso,
-        "run_id": DEFAULT_PINNED_RUN_ID,
-    }
-
-    incidents_dir = tmp_path / "incidents"
-    with deterministic_id_context(now=pinned_dt, seed=DEFAULT_PINNED_SEED):
-        alert = build_basic_alert(
-            event,
-            session=session,
-            determinism_mode="pinned",
-            determinism_context=determinism_context,
-            incident_dest_dir=incidents_dir,
-        )
+def test_pinned_demo_output_is_stable(tmp_path, ingested_session, raw_spill_event):
+    raw_spill_event["event_id"] = "EVT-DEMO-0001"
+    event = _link_pinned_event(ingested_session, raw_spill_event)
+    alert = _build_pinned_alert(ingested_session, event, tmp_path / "incidents")
 
     assert alert.alert_id == "ALERT-20251229-d31a370b"
 
@@ -72,7 +132,7 @@ def test_pinned_demo_output_is_stable(tmp_path, session):
     payload = json.loads(artifact_path.read_text(encoding="utf-8"))
 
     assert payload["determinism_mode"] == "pinned"
-    assert payload["determinism_context"] == determinism_context
+    assert payload["determinism_context"] == PINNED_DETERMINISM_CONTEXT
     assert payload["merge_reasons"] == []
     assert payload["merge_summary"] == []
     expected_hash = "8ab0c3c00fbd4e65164c8fed8e193452e8109b029958d38c41756d41c0968f0f"
@@ -80,77 +140,25 @@ def test_pinned_demo_output_is_stable(tmp_path, session):
     assert payload["artifact_hash"] == expected_hash
 
 
-def test_pinned_demo_replay_is_identical(tmp_path, session):
+def test_pinned_demo_replay_is_identical(tmp_path, ingested_session, raw_spill_event):
     """Test that running the pinned pipeline twice produces identical outputs."""
-    facilities = Path("tests/fixtures/facilities.csv")
-    lanes = Path("tests/fixtures/lanes.csv")
-    shipments = Path("tests/fixtures/shipments_snapshot.csv")
-    ingest_all_csvs(facilities, lanes, shipments, session)
-
-    event_path = Path("tests/fixtures/event_spill.json")
-    raw = json.loads(event_path.read_text(encoding="utf-8"))
-    raw["event_id"] = "EVT-DEMO-0001"
-
-    pinned_dt = DEFAULT_PINNED_TIMESTAMP
-    pinned_iso = pinned_dt.astimezone(UTC).isoformat().replace("+00:00", "Z")
-
-    determinism_context = {
-        "seed": DEFAULT_PINNED_SEED,
-        "timestamp_utc": pinned_iso,
-        "run_id": DEFAULT_PINNED_RUN_ID,
-    }
-
-    incidents_dir_1 = tmp_path / "incidents_1"
-    incidents_dir_2 = tmp_path / "incidents_2"
+    raw_spill_event["event_id"] = "EVT-DEMO-0001"
+    linked_event = _link_pinned_event(ingested_session, raw_spill_event)
 
-    # First run
-    event_1 = normalize_event(raw.copy())
-    event_1 = link_event_to_network(event_1, session=session)
-    event_1["event_time_utc"] = pinned_iso
-    event_1["published_at_utc"] = pinned_iso
-    event_1["scoring_now"] = pinned_dt
-
-    with deterministic_id_context(now=pinned_dt, seed=DEFAULT_PINNED_SEED):
-        alert_1 = build_basic_alert(
-            event_1,
-            session=session,
-            determinism_mode="pinned",
-            determinism_context=determinism_context,
-            incident_dest_dir=incidents_dir_1,
-        )
-
-    # Second run (fresh event dict, same inputs)
-    event_2 = normalize_event(raw.copy())
-    event_2 = link_event_to_network(event_2, session=session)
-    event_2["event_time_utc"] = pinned_iso
-    event_2["published_at_utc"] = pinned_iso
-    event_2["scoring_now"] = pinned_dt
-
-    with deterministic_id_context(now=pinned_dt, seed=DEFAULT_PINNED_SEED):
-        alert_2 = build_basic_alert(
-            event_2,
-            session=session,
-            determinism_mode="pinned",
-            determinism_context=determinism_context,
-            incident_dest_dir=incidents_dir_2,
-        )
+    # Build twice from independent copies of the same linked event
+    alert_1 = _build_pinned_alert(ingested_session, copy.deepcopy(linked_event), tmp_path / "incidents_1")
+    alert_2 = _build_pinned_alert(ingested_session, copy.deepcopy(linked_event), tmp_path / "incidents_2")
 
     # Assert deep equality on stable fields
     assert alert_1.alert_id == alert_2.alert_id, "Alert IDs must be identical"
     assert alert_1.classification == alert_2.classification, "Classifications must be identical"
     
-    # Scope comparison (convert to dict for comparison)
-    scope_1 = {
-        "facilities": sorted(alert_1.scope.facilities),
-        "lanes": sorted(alert_1.scope.lanes),
-        "shipments": sorted(alert_1.scope.shipments),
-    }
-    scope_2 = {
-        "facilities": sorted(alert_2.scope.facilities),
-        "lanes": sorted(alert_2.scope.lanes),
-        "shipments": sorted(alert_2.scope.shipments),
-    }
-    assert scope_1 == scope_2, f"Scopes must be identical: {scope_1} != {scope_2}"
+    # Scope comparison (order-insensitive: sort each scope list in place, then compare models)
+    for alert in (alert_1, alert_2):
+        alert.scope.facilities.sort()
+        alert.scope.lanes.sort()
+        alert.scope.shipments.sort()
+    assert alert_1.scope == alert_2.scope, f"Scopes must be identical: {alert_1.scope} != {alert_2.scope}"
     
     # Reasoning list (exact ordering)
     assert alert_1.reasoning == alert_2.reasoning, f"Reasoning must be identical: {alert_1.reasoning} != {alert_2.reasoning}"
@@ -161,50 +169,16 @@ def test_pinned_demo_replay_is_identical(tmp_path, session):
     assert qv_1 == qv_2, f"Quality validation must be identical: {qv_1} != {qv_2}"
 
 
-def test_no_nondeterministic_fields_in_alert_payload(tmp_path, session):
+def test_no_nondeterministic_fields_in_alert_payload(tmp_path, ingested_session, raw_spill_event):
     """Test that alert payloads contain no nondeterministic fields."""
-    import hashlib
-    import re
-    from datetime import datetime
-    
-    facilities = Path("tests/fixtures/facilities.csv")
-    lanes = Path("tests/fixtures/lanes.csv")
-    shipments = Path("tests/fixtures/shipments_snapshot.csv")
-    ingest_all_csvs(facilities, lanes, shipments, session)
-
-    event_path = Path("tests/fixtures/event_spill.json")
-    raw = json.loads(event_path.read_text(encoding="utf-8"))
-    raw["event_id"] = "EVT-DEMO-0001"
-
-    event = normalize_event(raw)
-    event = link_event_to_network(event, session=session)
-
-    pinned_dt = DEFAULT_PINNED_TIMESTAMP
-    pinned_iso = pinned_dt.astimezone(UTC).isoformat().replace("+00:00", "Z")
-    event["event_time_utc"] = pinned_iso
-    event["published_at_utc"] = pinned_iso
-    event["scoring_now"] = pinned_dt
-
-    determinism_context = {
-        "seed": DEFAULT_PINNED_SEED,
-        "timestamp_utc": pinned_iso,
-        "run_id": DEFAULT_PINNED_RUN_ID,
-    }
-
-    incidents_dir = tmp_path / "incidents"
-    with deterministic_id_context(now=pinned_dt, seed=DEFAULT_PINNED_SEED):
-        alert = build_basic_alert(
-            event,
-            session=session,
-            determinism_mode="pinned",
-            determinism_context=determinism_context,
-            incident_dest_dir=incidents_dir,
-        )
-
-    # Get payloads
-    alert_payload = alert.model_dump()
-    evidence_payload = alert.evidence.model_dump() if alert.evidence else {}
-    diagnostics_payload = alert.evidence.diagnostics.model_dump() if alert.evidence and alert.evidence.diagnostics else {}
+    raw_spill_event["event_id"] = "EVT-DEMO-0001"
+    event = _link_pinned_event(ingested_session, raw_spill_event)
+    alert = _build_pinned_alert(ingested_session, event, tmp_path / "incidents")
+
+    # Get payloads (one dump; evidence and diagnostics are subtrees of it)
+    alert_payload = alert.model_dump(exclude_none=True)
+    evidence_payload = alert_payload.get("evidence") or {}
+    diagnostics_payload = evidence_payload.get("diagnostics") or {}
     
     # Get incident artifact payload
     incident_summary = alert.evidence.incident_evidence if alert.evidence else None
@@ -214,60 +188,19 @@ def test_no_nondeterministic_fields_in_alert_payload(tmp_path, session):
         if artifact_path.exists():
             incident_payload = json.loads(artifact_path.read_text(encoding="utf-8"))
 
-    # Helper to recursively check for nondeterministic patterns
-    def check_nondeterministic(obj, path="", violations=None):
-        if violations is None:
-            violations = []
-        
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                current_path = f"{path}.{key}" if path else key
-                check_nondeterministic(value, current_path, violations)
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                check_nondeterministic(item, f"{path}[{i}]", violations)
-        elif isinstance(obj, str):
-            # Check for absolute paths (Windows and Unix)
-            if re.match(r'^[A-Za-z]:\\', obj) or obj.startswith('/'):
-                # Allow expected paths in incident artifacts
-                if 'artifact_path' in path or 'incidents' in obj.lower():
-                    pass  # Expected
-                else:
-                    violations.append(f"{path}: absolute path '{obj}'")
-            
-            # Check for random UUIDs (not from deterministic context)
-            uuid_pattern = r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
-            if re.search(uuid_pattern, obj.lower()):
-                # Allow deterministic IDs (ALERT- format or known patterns)
-                if not (obj.startswith('ALERT-') or 'demo' in obj.lower() or 'pinned' in obj.lower()):
-                    violations.append(f"{path}: potential random UUID '{obj}'")
-        
-        elif isinstance(obj, datetime):
-            # datetime objects should be pinned in determinism_mode="pinned"
-            # Check if it matches pinned timestamp (within reason)
-            if obj.tzinfo is None:
-                violations.append(f"{path}: naive datetime '{obj}'")
-        
-        return violations
-
-    # Check all payloads
+    # Check all payloads, stopping once enough violations are collected
+    payloads = [
+        (alert_payload, "alert"),
+        (evidence_payload, "evidence"),
+        (diagnostics_payload, "diagnostics"),
+        (incident_payload, "incident_artifact"),
+    ]
     all_violations = []
-    all_violations.extend(check_nondeterministic(alert_payload, "alert"))
-    all_violations.extend(check_nondeterministic(evidence_payload, "evidence"))
-    all_violations.extend(check_nondeterministic(diagnostics_payload, "diagnostics"))
-    all_violations.extend(check_nondeterministic(incident_payload, "incident_artifact"))
-
-    # Convert payloads to JSON strings to check for datetime.now() patterns
-    def json_string_check(payload_dict, name):
-        payload_str = json.dumps(payload_dict, default=str, sort_keys=True)
-        # Look for timestamps that don't match pinned timestamp
-        # This is a heuristic - actual datetime.now() calls would show current time
-        # In pinned mode, all timestamps should be the pinned timestamp or deterministic
-        pass  # More sophisticated check could go here
-
-    json_string_check(alert_payload, "alert")
-    json_string_check(evidence_payload, "evidence")
-    json_string_check(diagnostics_payload, "diagnostics")
-    json_string_check(incident_payload, "incident_artifact")
+    for payload, name in payloads:
+        all_violations.extend(
+            _find_nondeterministic(payload, name, max_violations=_MAX_VIOLATIONS - len(all_violations))
+        )
+        if len(all_violations) >= _MAX_VIOLATIONS:
+            pytest.fail(f"Found nondeterministic fields (first {_MAX_VIOLATIONS}): {all_violations}")
 
     assert len(all_violations) == 0, f"Found nondeterministic fields: {all_violations}"
@@ -1,5 +1,7 @@
 from datetime import datetime, timezone
 
+from sqlalchemy import event as sa_event
+
 from hardstop.database.schema import Facility, Lane, Shipment
 from hardstop.parsing.entity_extractor import link_to_network
 
@@ -36,8 +38,25 @@ def test_link_to_network_uses_pinned_time(session):
     event = {"facilities": ["PLANT-01"], "title": "Test event"}
     pinned_now = datetime(2025, 1, 1, tzinfo=timezone.utc)
 
-    first = link_to_network(dict(event), session, now=pinned_now)
-    second = link_to_network(dict(event), session, now=pinned_now)
+    # Count queries per call so a replay that adds queries (N+1) is caught too;
+    # SAVEPOINT bookkeeping from the test session is not counted
+    statements = []
+
+    def _count_statement(_conn, _cursor, statement, *_args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    sa_event.listen(session.bind, "before_cursor_execute", _count_statement)
+    try:
+        first = link_to_network(dict(event), session, now=pinned_now)
+        first_statement_count = len(statements)
+        statements.clear()
+        second = link_to_network(dict(event), session, now=pinned_now)
+        second_statement_count = len(statements)
+    finally:
+        sa_event.remove(session.bind, "before_cursor_execute", _count_statement)
 
     assert first == second
+    assert first_statement_count > 0
+    assert second_statement_count == first_statement_count
     assert first["shipments"] == ["SHIP-1"]
@@ -1,5 +1,7 @@
 """Tests for export API contracts."""
 
+import csv
+import io
 import json
 from datetime import datetime, timezone
 from pathlib import Path
@@ -56,10 +58,9 @@ def test_export_alerts_csv_has_required_columns_and_row_count(session):
     
     # Export alerts as CSV
     csv_output = export_alerts(session, since="24h", limit=50, format="csv")
-    csv_lines = csv_output.strip().split("\n")
+    reader = csv.reader(io.StringIO(csv_output))
     
     # Check header
-    header = csv_lines[0]
     required_columns = [
         "alert_id",
         "classification",
@@ -74,11 +75,12 @@ def test_export_alerts_csv_has_required_columns_and_row_count(session):
         "summary",
     ]
     
-    header_cols = [col.strip() for col in header.split(",")]
+    header_cols = next(reader)
     assert header_cols == required_columns, f"CSV header mismatch: expected {required_columns}, got {header_cols}"
     
-    # Check row count (header + data rows)
-    assert len(csv_lines) == len(alerts) + 1, f"CSV row count mismatch: expected {len(alerts) + 1} (header + {len(alerts)} rows), got {len(csv_lines)}"
+    # Check data row count (csv.reader handles quoted commas and newlines in summaries)
+    row_count = sum(1 for _ in reader)
+    assert row_count == len(alerts), f"CSV row count mismatch: expected {len(alerts)} data rows, got {row_count}"
 
 
 def test_export_alerts_filtering_happens_before_limit(session):
@@ -52,3 +52,69 @@ def test_best_effort_metadata_records_seed_and_inputs(monkeypatch):
     assert metadata["seed"] == 99
     assert metadata["inputs_version"] == "source-1:demo@1"
     assert "jitter_seconds" in metadata["notes"]
+
+
+def test_rate_limit_disabled_skips_sleep_and_jitter(monkeypatch):
+    sources_config = {"defaults": {"rate_limit": {"per_host_min_seconds": 0, "jitter_seconds": 5}}}
+    fetcher = SourceFetcher(sources_config, strict=False, rng_seed=123)
+    host = "https://example.com"
+
+    monkeypatch.setattr(fetcher_mod.time, "time", lambda: 10.0)
+    monkeypatch.setattr(fetcher_mod.time, "sleep", lambda _seconds: pytest.fail("unexpected sleep"))
+    monkeypatch.setattr(fetcher._rng, "uniform", lambda *_args: pytest.fail("unexpected jitter draw"))
+
+    fetcher._wait_for_rate_limit(host)
+
+    assert fetcher._last_fetch_time[fetcher._get_host_from_url(host)] == 10.0
+
+
+def test_rate_limit_per_tier_caps_requests_across_hosts(monkeypatch):
+    sources_config = {
+        "defaults": {
+            "rate_limit": {
+                "per_host_min_seconds": 1,
+                "jitter_seconds": 0,
+                "per_tier_min_seconds": {"global": 3},
+            }
+        }
+    }
+    fetcher = SourceFetcher(sources_config, strict=True, rng_seed=123)
+
+    monkeypatch.setattr(fetcher_mod.time, "time", lambda: 10.0)
+    sleep_calls = []
+    monkeypatch.setattr(fetcher_mod.time, "sleep", lambda seconds: sleep_calls.append(seconds))
+    fetcher._last_tier_fetch_time["global"] = 9.0
+
+    # Different host, same tier: tier interval applies even with no host history
+    fetcher._wait_for_rate_limit("https://other.example.com", "global")
+    # Untracked tier only waits on the host interval
+    fetcher._wait_for_rate_limit("https://regional.example.com", "regional")
+
+    assert sleep_calls == [pytest.approx(2.0)]
+    assert fetcher._last_tier_fetch_time["global"] == 10.0
+
+
+def test_rate_limit_per_tier_rejects_non_mapping(monkeypatch, caplog):
+    sources_config = {
+        "defaults": {
+            "rate_limit": {"per_host_min_seconds": 0, "jitter_seconds": 0, "per_tier_min_seconds": 1}
+        }
+    }
+    fetcher = SourceFetcher(sources_config, strict=True, rng_seed=123)
+
+    assert fetcher.per_tier_min_seconds == {}
+    assert "per_tier_min_seconds" in caplog.text
+
+    monkeypatch.setattr(fetcher_mod.time, "time", lambda: 10.0)
+    monkeypatch.setattr(fetcher_mod.time, "sleep", lambda _seconds: pytest.fail("unexpected sleep"))
+    # A scalar setting must not break fetching
+    fetcher._wait_for_rate_limit("https://example.com", "global")
+
+
+def test_rate_limit_per_tier_coerces_values_to_float():
+    sources_config = {
+        "defaults": {"rate_limit": {"per_tier_min_seconds": {"global": "3", "local": "soon"}}}
+    }
+    fetcher = SourceFetcher(sources_config, strict=True, rng_seed=123)
+
+    assert fetcher.per_tier_min_seconds == {"global": 3.0}
@@ -1,8 +1,8 @@
 """Tests for network impact scoring."""
 
 import pytest
-from datetime import date, datetime, timedelta, timezone
-from unittest.mock import Mock
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 
 from hardstop.alerts.impact_scorer import (
     calculate_network_impact_score,
@@ -12,6 +12,62 @@ from hardstop.alerts.impact_scorer import (
 )
 from hardstop.database.schema import Facility, Lane, Shipment
 
+# Pinned scoring clock shared by the shipment ETA tests
+FIXED_NOW = datetime(2024, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
+ETA_1D = (FIXED_NOW.date() + timedelta(days=1)).isoformat()
+ETA_3D = (FIXED_NOW.date() + timedelta(days=3)).isoformat()
+
+# Unlinked GENERAL event; tests merge in only the fields they exercise
+_BASE_EVENT = {"facilities": [], "lanes": [], "shipments": [], "event_type": "GENERAL"}
+
+
+@dataclass(slots=True)
+class _FacilityRow:
+    """Plain stand-in for the Facility columns the scorer reads."""
+
+    facility_id: str
+    criticality_score: int
+
+
+@dataclass(slots=True)
+class _LaneRow:
+    """Plain stand-in for the Lane columns the scorer reads."""
+
+    lane_id: str
+    volume_score: int
+
+
+@dataclass(slots=True)
+class _ShipmentRow:
+    """Plain stand-in for the Shipment columns the scorer reads."""
+
+    shipment_id: str
+    priority_flag: int
+    eta_date: object
+
+
+class _FakeQuery:
+    """Query stand-in: filter() is a no-op, all() returns the preset rows."""
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def filter(self, *_criteria):
+        return self
+
+    def all(self):
+        return list(self._rows)
+
+
+class _FakeSession:
+    """Session stand-in whose query(model).filter(...).all() returns rows preset per model."""
+
+    def __init__(self, rows_by_model=None):
+        self._rows_by_model = rows_by_model or {}
+
+    def query(self, model):
+        return _FakeQuery(self._rows_by_model.get(model, []))
+
 
 class TestMapScoreToClassification:
     """Test classification mapping from impact scores."""
@@ -28,6 +84,12 @@ class TestMapScoreToClassification:
         assert map_score_to_classification(4) == 2
         assert map_score_to_classification(5) == 2
         assert map_score_to_classification(10) == 2
+    
+    def test_out_of_range_scores_clamp(self):
+        """Scores outside 0-10 clamp to the nearest classification instead of wrapping."""
+        assert map_score_to_classification(-1) == 0
+        assert map_score_to_classification(-5) == 0
+        assert map_score_to_classification(16) == 2
 
 
 class TestCalculateNetworkImpactScore:
@@ -35,20 +97,12 @@ class TestCalculateNetworkImpactScore:
     
     def test_uses_db_values_not_input_severity(self):
         """Verify scoring uses DB-driven values, not input severity_guess."""
-        # Create mock session with high-impact facility
-        session = Mock()
-        facility = Mock(spec=Facility)
-        facility.facility_id = "PLANT-01"
-        facility.criticality_score = 8  # High criticality
+        # Create session with high-impact facility
+        facility = _FacilityRow(facility_id="PLANT-01", criticality_score=8)  # High criticality
+        session = _FakeSession({Facility: [facility]})
         
-        session.query.return_value.filter.return_value.all.return_value = [facility]
-        session.query.return_value.filter.return_value.in_.return_value = None
-        
-        event = {
+        event = _BASE_EVENT | {
             "facilities": ["PLANT-01"],
-            "lanes": [],
-            "shipments": [],
-            "event_type": "GENERAL",
             "severity_guess": 0,  # Low input severity
         }
         
@@ -56,143 +110,80 @@ class TestCalculateNetworkImpactScore:
         
         # Should score based on facility criticality, not input severity
         assert score >= 2  # At least +2 for high criticality facility
-        assert any("criticality_score" in b for b in breakdown)
+        assert "criticality_score" in "\n".join(breakdown)
         assert rationale["network_criticality"]["facilities"][0]["facility_id"] == "PLANT-01"
     
     def test_facility_criticality_scoring(self):
         """Test facility criticality scoring with 1-10 scale."""
-        session = Mock()
-        
         # High criticality facility (>=7)
-        high_facility = Mock(spec=Facility)
-        high_facility.facility_id = "PLANT-01"
-        high_facility.criticality_score = 8
+        high_facility = _FacilityRow(facility_id="PLANT-01", criticality_score=8)
         
         # Low criticality facility (<7)
-        low_facility = Mock(spec=Facility)
-        low_facility.facility_id = "DC-01"
-        low_facility.criticality_score = 5
-        
-        def query_side_effect(model):
-            if model == Facility:
-                mock_query = Mock()
-                mock_query.filter.return_value.all.return_value = [high_facility]
-                return mock_query
-            return Mock()
+        low_facility = _FacilityRow(facility_id="DC-01", criticality_score=5)
         
-        session.query.side_effect = query_side_effect
+        session = _FakeSession({Facility: [high_facility]})
         
-        event = {
-            "facilities": ["PLANT-01"],
-            "lanes": [],
-            "shipments": [],
-            "event_type": "GENERAL",
-        }
+        event = _BASE_EVENT | {"facilities": ["PLANT-01"]}
         
         score, breakdown, rationale = calculate_network_impact_score(event, session)
         
         # High criticality should add +2
         assert score >= 2
-        assert any(">= 7" in b and "PLANT-01" in b for b in breakdown)
+        assert ">= 7 (PLANT-01=" in "\n".join(breakdown)
         
         # Test with low criticality
-        def query_side_effect_low(model):
-            if model == Facility:
-                mock_query = Mock()
-                mock_query.filter.return_value.all.return_value = [low_facility]
-                return mock_query
-            return Mock(filter=lambda **kw: Mock(all=lambda: []))
-        
-        session.query.side_effect = query_side_effect_low
+        session = _FakeSession({Facility: [low_facility]})
         score2, _, rationale2 = calculate_network_impact_score(event, session)
         assert score2 < score  # Lower score for low criticality
         assert rationale2["network_criticality"]["facilities"] == []
     
     def test_lane_volume_scoring(self):
         """Test lane volume scoring with 1-10 scale."""
-        session = Mock()
-        
-        high_lane = Mock(spec=Lane)
-        high_lane.lane_id = "LANE-001"
-        high_lane.volume_score = 8
-        
-        def query_side_effect(model):
-            if model == Lane:
-                mock_query = Mock()
-                mock_query.filter.return_value.all.return_value = [high_lane]
-                return mock_query
-            mock_query = Mock()
-            mock_query.filter.return_value.all.return_value = []
-            return mock_query
-        
-        session.query.side_effect = query_side_effect
-        
-        event = {
-            "facilities": [],
-            "lanes": ["LANE-001"],
-            "shipments": [],
-            "event_type": "GENERAL",
-        }
+        high_lane = _LaneRow(lane_id="LANE-001", volume_score=8)
+        
+        session = _FakeSession({Lane: [high_lane]})
+        
+        event = _BASE_EVENT | {"lanes": ["LANE-001"]}
         
         score, breakdown, rationale = calculate_network_impact_score(event, session)
         
         # High volume should add +1
         assert score >= 1
-        assert any("volume_score" in b and ">= 7" in b for b in breakdown)
+        assert "volume_score >= 7" in "\n".join(breakdown)
         assert rationale["network_criticality"]["lanes"][0]["lane_id"] == "LANE-001"
     
     def test_shipment_priority_scoring(self):
         """Test enhanced shipment priority scoring."""
-        session = Mock()
-        
         # Create priority shipments
-        priority_ship1 = Mock(spec=Shipment)
-        priority_ship1.shipment_id = "SHP-001"
-        priority_ship1.priority_flag = 1
-        priority_ship1.eta_date = (date.today() + timedelta(days=1)).strftime("%Y-%m-%d")
-        
-        priority_ship2 = Mock(spec=Shipment)
-        priority_ship2.shipment_id = "SHP-002"
-        priority_ship2.priority_flag = 1
-        priority_ship2.eta_date = (date.today() + timedelta(days=3)).strftime("%Y-%m-%d")
-        
-        def query_side_effect(model):
-            if model == Shipment:
-                mock_query = Mock()
-                mock_query.filter.return_value.all.return_value = [priority_ship1, priority_ship2]
-                return mock_query
-            mock_query = Mock()
-            mock_query.filter.return_value.all.return_value = []
-            return mock_query
-        
-        session.query.side_effect = query_side_effect
-        
-        event = {
-            "facilities": [],
-            "lanes": [],
-            "shipments": ["SHP-001", "SHP-002"],
-            "event_type": "GENERAL",
-        }
+        priority_ship1 = _ShipmentRow(
+            shipment_id="SHP-001",
+            priority_flag=1,
+            eta_date=ETA_1D,
+        )
+        
+        priority_ship2 = _ShipmentRow(
+            shipment_id="SHP-002",
+            priority_flag=1,
+            eta_date=ETA_3D,
+        )
+        
+        session = _FakeSession({Shipment: [priority_ship1, priority_ship2]})
+        
+        event = _BASE_EVENT | {"shipments": ["SHP-001", "SHP-002"]}
         
-        fixed_now = datetime(2024, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
-        score, breakdown, rationale = calculate_network_impact_score(event, session, now=fixed_now)
+        score, breakdown, rationale = calculate_network_impact_score(event, session, now=FIXED_NOW)
         
         # Should have at least +1 for priority shipments
         assert score >= 1
-        assert any("Priority shipments" in b for b in breakdown)
+        assert "Priority shipments" in "\n".join(breakdown)
         assert rationale["network_criticality"]["priority_shipments"]["count"] == 2
     
     def test_event_type_keyword_scoring(self):
         """Test event type and keyword detection."""
-        session = Mock()
-        session.query.return_value.filter.return_value.all.return_value = []
+        session = _FakeSession()
         
         # Test keyword in text
-        event = {
-            "facilities": [],
-            "lanes": [],
-            "shipments": [],
-            "event_type": "GENERAL",
+        event = _BASE_EVENT | {
             "title": "Chemical spill at facility",
             "raw_text": "",
         }
@@ -201,78 +192,49 @@ class TestCalculateNetworkImpactScore:
         
         # Should detect "spill" keyword
         assert score >= 1
-        assert any("keyword" in b.lower() or "spill" in b.lower() for b in breakdown)
+        breakdown_text = "\n".join(breakdown).lower()
+        assert "keyword" in breakdown_text or "spill" in breakdown_text
         assert "SPILL" in rationale["score_trace"]["keyword_terms"]
     
     def test_eta_within_48h_scoring(self):
         """Test ETA within 48h scoring with various date scenarios."""
-        session = Mock()
-        
         # Create priority shipments with different ETA scenarios
-        reference_date = date(2024, 1, 10)
-        
-        # Shipment within 48h (tomorrow end-of-day relative to fixed_now)
-        near_ship = Mock(spec=Shipment)
-        near_ship.shipment_id = "SHP-NEAR"
-        near_ship.priority_flag = 1
-        near_ship.eta_date = (reference_date + timedelta(days=1)).strftime("%Y-%m-%d")
+        # Shipment within 48h (tomorrow end-of-day relative to FIXED_NOW)
+        near_ship = _ShipmentRow(
+            shipment_id="SHP-NEAR",
+            priority_flag=1,
+            eta_date=ETA_1D,
+        )
         
         # Shipment beyond 48h (3 days out)
-        far_ship = Mock(spec=Shipment)
-        far_ship.shipment_id = "SHP-FAR"
-        far_ship.priority_flag = 1
-        far_ship.eta_date = (reference_date + timedelta(days=3)).strftime("%Y-%m-%d")
+        far_ship = _ShipmentRow(
+            shipment_id="SHP-FAR",
+            priority_flag=1,
+            eta_date=ETA_3D,
+        )
         
         # Shipment with bad date
-        bad_ship = Mock(spec=Shipment)
-        bad_ship.shipment_id = "SHP-BAD"
-        bad_ship.priority_flag = 1
-        bad_ship.eta_date = "invalid-date-format"
+        bad_ship = _ShipmentRow(shipment_id="SHP-BAD", priority_flag=1, eta_date="invalid-date-format")
         
         # Shipment with None ETA
-        no_eta_ship = Mock(spec=Shipment)
-        no_eta_ship.shipment_id = "SHP-NO-ETA"
-        no_eta_ship.priority_flag = 1
-        no_eta_ship.eta_date = None
-        
-        def query_side_effect(model):
-            if model == Shipment:
-                mock_query = Mock()
-                mock_query.filter.return_value.all.return_value = [
-                    near_ship, far_ship, bad_ship, no_eta_ship
-                ]
-                return mock_query
-            mock_query = Mock()
-            mock_query.filter.return_value.all.return_value = []
-            return mock_query
-        
-        session.query.side_effect = query_side_effect
-        
-        event = {
-            "facilities": [],
-            "lanes": [],
-            "shipments": ["SHP-NEAR", "SHP-FAR", "SHP-BAD", "SHP-NO-ETA"],
-            "event_type": "GENERAL",
-        }
+        no_eta_ship = _ShipmentRow(shipment_id="SHP-NO-ETA", priority_flag=1, eta_date=None)
+        
+        session = _FakeSession({Shipment: [near_ship, far_ship, bad_ship, no_eta_ship]})
         
-        fixed_now = datetime(2024, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
-        score, breakdown, rationale = calculate_network_impact_score(event, session, now=fixed_now)
+        event = _BASE_EVENT | {"shipments": ["SHP-NEAR", "SHP-FAR", "SHP-BAD", "SHP-NO-ETA"]}
+        
+        score, breakdown, rationale = calculate_network_impact_score(event, session, now=FIXED_NOW)
         
         # Should have +1 for priority shipments
+        breakdown_text = "\n".join(breakdown)
         assert score >= 1
-        assert any("Priority shipments" in b for b in breakdown)
-        
-        # Should have +1 for ETA within 48h (only near_ship should count)
-        assert any("within 48h" in b for b in breakdown)
-        # Verify it only counted the near-term shipment
-        for b in breakdown:
-            if "within 48h" in b:
-                assert "1 shipments" in b  # Only near_ship should be within 48h
+        assert "Priority shipments" in breakdown_text
+        
+        # Should have +1 for ETA within 48h, counting only near_ship
+        assert "within 48h (1 shipments)" in breakdown_text
     
     def test_bad_date_handling(self):
         """Test that bad dates don't crash the pipeline."""
-        session = Mock()
-        
         # Create shipments with various bad date formats
         bad_dates = [
             "not-a-date",
@@ -286,64 +248,41 @@ class TestCalculateNetworkImpactScore:
         
         shipments = []
         for i, bad_date in enumerate(bad_dates):
-            ship = Mock(spec=Shipment)
-            ship.shipment_id = f"SHP-BAD-{i}"
-            ship.priority_flag = 1
-            ship.eta_date = bad_date
+            ship = _ShipmentRow(shipment_id=f"SHP-BAD-{i}", priority_flag=1, eta_date=bad_date)
             shipments.append(ship)
         
-        def query_side_effect(model):
-            if model == Shipment:
-                mock_query = Mock()
-                mock_query.filter.return_value.all.return_value = shipments
-                return mock_query
-            mock_query = Mock()
-            mock_query.filter.return_value.all.return_value = []
-            return mock_query
-        
-        session.query.side_effect = query_side_effect
-        
-        event = {
-            "facilities": [],
-            "lanes": [],
-            "shipments": [s.shipment_id for s in shipments],
-            "event_type": "GENERAL",
-        }
+        session = _FakeSession({Shipment: shipments})
+        
+        event = _BASE_EVENT | {"shipments": [s.shipment_id for s in shipments]}
         
         # Should not crash, should just skip bad dates
-        fixed_now = datetime(2024, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
-        score, breakdown, rationale = calculate_network_impact_score(event, session, now=fixed_now)
+        score, breakdown, rationale = calculate_network_impact_score(event, session, now=FIXED_NOW)
         
         # Should still score for priority shipments
+        breakdown_text = "\n".join(breakdown)
         assert score >= 1
-        assert any("Priority shipments" in b for b in breakdown)
+        assert "Priority shipments" in breakdown_text
         
         # Should not have 48h score since all dates are bad
-        assert not any("within 48h" in b for b in breakdown)
+        assert "within 48h" not in breakdown_text
     
     def test_rationale_tracks_modifiers_and_suppression(self):
         """Rationale should pin modifiers and suppression context deterministically."""
-        session = Mock()
-        session.query.return_value.filter.return_value.all.return_value = []
-        
-        event = {
-            "facilities": [],
-            "lanes": [],
-            "shipments": [],
-            "event_type": "GENERAL",
+        session = _FakeSession()
+        
+        event = _BASE_EVENT | {
             "suppression_status": "SUPPRESSED",
             "suppression_primary_rule_id": "rule-9",
             "suppression_rule_ids": ["rule-2", "rule-9"],
             "suppression_reason_code": "duplicate",
         }
         
-        fixed_now = datetime(2024, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
         score, breakdown, rationale = calculate_network_impact_score(
             event,
             session,
             trust_tier=3,
             weighting_bias=2,
-            now=fixed_now,
+            now=FIXED_NOW,
         )
         
         assert rationale["modifiers"]["trust_tier"] == 3
@@ -366,7 +305,7 @@ class TestEtaParsing:
         """Test parsing date-only strings (YYYY-MM-DD)."""
         result = parse_eta_date_safely("2024-01-15")
         assert result is not None
-        assert result.date() == date(2024, 1, 15)
+        assert (result.year, result.month, result.day) == (2024, 1, 15)
         # Should be end-of-day UTC (23:59:59)
         assert result.hour == 23
         assert result.minute == 59
@@ -1,6 +1,5 @@
 """Tests for offline mode operation (no network adapters)."""
 
-import json
 from pathlib import Path
 from unittest.mock import patch
 
@@ -9,8 +8,10 @@ from hardstop.ingestion.file_ingestor import ingest_all_csvs
 from hardstop.parsing.network_linker import link_event_to_network
 from hardstop.parsing.normalizer import normalize_event
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
-def test_offline_mode_with_file_fixtures(tmp_path, session):
+
+def test_offline_mode_with_file_fixtures(tmp_path, session, raw_spill_event):
     """Test that system runs fully local with file fixtures only (no network adapters)."""
     # Monkeypatch requests.get to raise if any network call is attempted
     def network_tripwire(*args, **kwargs):
@@ -24,18 +25,17 @@ def test_offline_mode_with_file_fixtures(tmp_path, session):
         with patch('requests.post', side_effect=network_tripwire):
             with patch('requests.request', side_effect=network_tripwire):
                 # Load network data from CSV files (local)
-                facilities = Path("tests/fixtures/facilities.csv")
-                lanes = Path("tests/fixtures/lanes.csv")
-                shipments = Path("tests/fixtures/shipments_snapshot.csv")
+                facilities = FIXTURES_DIR / "facilities.csv"
+                lanes = FIXTURES_DIR / "lanes.csv"
+                shipments = FIXTURES_DIR / "shipments_snapshot.csv"
                 
                 counts = ingest_all_csvs(facilities, lanes, shipments, session)
                 assert counts["facilities"] > 0, "Should load facilities from CSV"
                 assert counts["lanes"] > 0, "Should load lanes from CSV"
                 assert counts["shipments"] > 0, "Should load shipments from CSV"
                 
-                # Load event from file fixture (local)
-                event_path = Path("tests/fixtures/event_spill.json")
-                raw = json.loads(event_path.read_text(encoding="utf-8"))
+                # Event from file fixture (local)
+                raw = raw_spill_event
                 raw["event_id"] = "EVT-OFFLINE-0001"
                 
                 # Normalize event (no network calls)
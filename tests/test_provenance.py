@@ -8,25 +8,50 @@ from hardstop.database.source_run_repo import create_source_run
 from hardstop.database.event_repo import save_event
 from hardstop.database.raw_item_repo import save_raw_item
 
+BASE_TIME = datetime(2024, 5, 1, tzinfo=timezone.utc)
+EARLY_TIME = BASE_TIME.isoformat()
+LATER_TIME = (BASE_TIME + timedelta(hours=2)).isoformat()
 
-def test_alert_provenance_first_seen_uses_earliest_raw_item(session):
-    base_time = datetime(2024, 5, 1, tzinfo=timezone.utc)
-    first_seen_time = base_time.isoformat()
-    later_time = (base_time + timedelta(hours=2)).isoformat()
 
+def _create_updated_alert(session, alert_id, summary, root_event_id, updated_root_event_id, correlation_key):
+    """Create an alert on one root event, then update it onto another and commit."""
+    alert_row = upsert_new_alert_row(
+        session,
+        alert_id=alert_id,
+        summary=summary,
+        risk_type="TEST",
+        classification=1,
+        status="OPEN",
+        reasoning=None,
+        recommended_actions=None,
+        root_event_id=root_event_id,
+        correlation_key=correlation_key,
+    )
+    update_existing_alert_row(
+        session,
+        alert_row,
+        new_summary=f"{summary} updated",
+        new_classification=1,
+        root_event_id=updated_root_event_id,
+        correlation_action="UPDATED",
+    )
+    session.commit()
+
+
+def test_alert_provenance_first_seen_uses_earliest_raw_item(session):
     raw_item_first = save_raw_item(
         session,
         source_id="SRC-FIRST",
         tier="global",
         candidate={"payload": {"id": "one"}},
-        fetched_at_utc=first_seen_time,
+        fetched_at_utc=EARLY_TIME,
     )
     raw_item_later = save_raw_item(
         session,
         source_id="SRC-LATER",
         tier="local",
         candidate={"payload": {"id": "two"}},
-        fetched_at_utc=later_time,
+        fetched_at_utc=LATER_TIME,
     )
 
     save_event(
@@ -36,7 +61,7 @@ def test_alert_provenance_first_seen_uses_earliest_raw_item(session):
             "source_type": "TEST",
             "source_id": "SRC-FIRST",
             "raw_id": raw_item_first.raw_id,
-            "event_time_utc": first_seen_time,
+            "event_time_utc": EARLY_TIME,
         },
     )
     save_event(
@@ -46,31 +71,13 @@ def test_alert_provenance_first_seen_uses_earliest_raw_item(session):
             "source_type": "TEST",
             "source_id": "SRC-LATER",
             "raw_id": raw_item_later.raw_id,
-            "event_time_utc": later_time,
+            "event_time_utc": LATER_TIME,
         },
     )
 
-    alert_row = upsert_new_alert_row(
-        session,
-        alert_id="ALERT-PROV-1",
-        summary="Provenance test alert",
-        risk_type="TEST",
-        classification=1,
-        status="OPEN",
-        reasoning=None,
-        recommended_actions=None,
-        root_event_id="EVT-PROV-1",
-        correlation_key="prov:test:1",
-    )
-    update_existing_alert_row(
-        session,
-        alert_row,
-        new_summary="Provenance test alert updated",
-        new_classification=1,
-        root_event_id="EVT-PROV-2",
-        correlation_action="UPDATED",
+    _create_updated_alert(
+        session, "ALERT-PROV-1", "Provenance test alert", "EVT-PROV-1", "EVT-PROV-2", "prov:test:1"
     )
-    session.commit()
 
     detail = get_alert_detail(session, "ALERT-PROV-1")
     assert detail is not None
@@ -80,16 +87,13 @@ def test_alert_provenance_first_seen_uses_earliest_raw_item(session):
 
 
 def test_alert_provenance_falls_back_to_event_time(session):
-    early_time = datetime(2024, 6, 1, tzinfo=timezone.utc).isoformat()
-    later_time = datetime(2024, 6, 1, 1, tzinfo=timezone.utc).isoformat()
-
     save_event(
         session,
         {
             "event_id": "EVT-PROV-3",
             "source_type": "TEST",
             "source_id": "SRC-EVENT",
-            "event_time_utc": early_time,
+            "event_time_utc": EARLY_TIME,
         },
     )
     save_event(
@@ -98,31 +102,13 @@ def test_alert_provenance_falls_back_to_event_time(session):
             "event_id": "EVT-PROV-4",
             "source_type": "TEST",
             "source_id": "SRC-LATER",
-            "event_time_utc": later_time,
+            "event_time_utc": LATER_TIME,
         },
     )
 
-    alert_row = upsert_new_alert_row(
-        session,
-        alert_id="ALERT-PROV-2",
-        summary="Event time provenance",
-        risk_type="TEST",
-        classification=1,
-        status="OPEN",
-        reasoning=None,
-        recommended_actions=None,
-        root_event_id="EVT-PROV-4",
-        correlation_key="prov:test:2",
-    )
-    update_existing_alert_row(
-        session,
-        alert_row,
-        new_summary="Event time provenance updated",
-        new_classification=1,
-        root_event_id="EVT-PROV-3",
-        correlation_action="UPDATED",
+    _create_updated_alert(
+        session, "ALERT-PROV-2", "Event time provenance", "EVT-PROV-4", "EVT-PROV-3", "prov:test:2"
     )
-    session.commit()
 
     detail = get_alert_detail(session, "ALERT-PROV-2")
     assert detail is not None
@@ -132,19 +118,17 @@ def test_alert_provenance_falls_back_to_event_time(session):
 
 
 def test_alert_detail_includes_source_runs_summary(session):
-    run_time = datetime(2024, 7, 1, tzinfo=timezone.utc).isoformat()
     create_source_run(
         session,
         run_group_id="RUN-GROUP-1",
         source_id="SRC-DETAIL",
         phase="FETCH",
-        run_at_utc=run_time,
+        run_at_utc=EARLY_TIME,
         status="SUCCESS",
         status_code=200,
         items_fetched=5,
         items_new=2,
     )
-    session.commit()
 
     upsert_new_alert_row(
         session,
@@ -2,7 +2,9 @@ import json
 from datetime import datetime, timedelta, timezone
 
 from hardstop.database.raw_item_repo import (
+    get_raw_item_keys_for_ingest,
     get_raw_items_for_ingest,
+    iter_raw_items_by_ids,
     mark_raw_item_status,
     save_raw_item,
 )
@@ -109,3 +111,23 @@ def test_refetch_failed_raw_item_with_old_publish_date_survives_since_filter(ses
     assert refetched.status == "NEW"
     assert refetched.published_at_utc == old_published_at
     assert refetched.raw_id in queued_ids
+
+
+def test_raw_item_keys_stream_in_ingest_order(session):
+    for index, source_id in enumerate(["source-b", "source-a", "source-b"]):
+        save_raw_item(
+            session,
+            source_id=source_id,
+            tier="global",
+            candidate={"canonical_id": f"item-{index}", "title": f"Item {index}", "payload": {}},
+            fetched_at_utc=f"2026-01-0{index + 1}T00:00:00+00:00",
+        )
+    session.commit()
+
+    keys = get_raw_item_keys_for_ingest(session)
+    expected = [(item.raw_id, item.source_id) for item in get_raw_items_for_ingest(session)]
+    assert keys == expected
+
+    raw_ids = [raw_id for raw_id, _ in keys] + ["missing-id"]
+    streamed = list(iter_raw_items_by_ids(session, raw_ids, batch_size=2))
+    assert [item.raw_id for item in streamed] == raw_ids[:-1]
@@ -38,7 +38,7 @@ def test_fingerprint_config_stable():
     assert fingerprint_config(snapshot) == expected
 
 
-def test_emit_run_record_matches_schema(tmp_path: Path):
+def test_emit_run_record_matches_schema(tmp_path: Path, run_record_schema):
     input_ref = ArtifactRef(
         id="run-group-123",
         hash="d2b2ce9d8c9e4fd6958be1c179c3f5f9d7cc696ef7e0f0cc8f71bb5c8a0697ec",
@@ -62,8 +62,7 @@ def test_emit_run_record_matches_schema(tmp_path: Path):
     files = list(tmp_path.glob("*.json"))
     assert files, "expected run record file to be created"
     data = json.loads(files[0].read_text(encoding="utf-8"))
-    schema = json.loads(Path("docs/specs/run-record.schema.json").read_text(encoding="utf-8"))
-    jsonschema.validate(instance=data, schema=schema)
+    jsonschema.validate(instance=data, schema=run_record_schema)
     assert record.config_hash == fingerprint_config({"runtime": {"version": "1.0.0"}})
 
 
@@ -106,7 +105,7 @@ def test_emit_run_record_replay_mode_fixed_identifiers(tmp_path: Path):
     assert record.config_hash == fingerprint_config({"runtime": {"version": "1.2.3"}, "sources": {"a": 1}})
 
 
-def test_emit_run_record_failure_includes_errors_and_schema_valid(tmp_path: Path):
+def test_emit_run_record_failure_includes_errors_and_schema_valid(tmp_path: Path, run_record_schema):
     run_group_id = "rg-123"
     config_snapshot = {
         "runtime": {"mode": "strict", "run_group_id": run_group_id, "version": "9.9.9"},
@@ -143,8 +142,7 @@ def test_emit_run_record_failure_includes_errors_and_schema_valid(tmp_path: Path
     files = sorted(tmp_path.glob("*.json"))
     assert files, "expected run record file to be created"
     data = json.loads(files[-1].read_text(encoding="utf-8"))
-    schema = json.loads(Path("docs/specs/run-record.schema.json").read_text(encoding="utf-8"))
-    jsonschema.validate(instance=data, schema=schema)
+    jsonschema.validate(instance=data, schema=run_record_schema)
     expected_hash = fingerprint_config(config_snapshot)
     assert data["errors"][0]["code"] == "ERR500"
     assert data["errors"][0]["details"]["phase"] == "ingest"
@@ -185,7 +183,7 @@ def test_resolve_config_snapshot_produces_stable_hash(monkeypatch):
     assert fingerprint_config(second_snapshot) == expected_hash
 
 
-def test_emit_run_record_cli_smoke_deterministic_filename(tmp_path: Path):
+def test_emit_run_record_cli_smoke_deterministic_filename(tmp_path: Path, run_record_schema):
     started_at = "2024-03-03T10:11:12Z"
     run_id = "22222222-2222-2222-2222-222222222222"
     dest_dir = tmp_path / "cli"
@@ -207,13 +205,12 @@ def test_emit_run_record_cli_smoke_deterministic_filename(tmp_path: Path):
     )
     assert expected_filename.exists()
     data = json.loads(expected_filename.read_text(encoding="utf-8"))
-    schema = json.loads(Path("docs/specs/run-record.schema.json").read_text(encoding="utf-8"))
-    jsonschema.validate(instance=data, schema=schema)
+    jsonschema.validate(instance=data, schema=run_record_schema)
     assert data["run_id"] == run_id
     assert data["mode"] == "best-effort"
 
 
-def test_cmd_incidents_replay_emits_run_record(monkeypatch, tmp_path: Path):
+def test_cmd_incidents_replay_emits_run_record(monkeypatch, tmp_path: Path, run_record_schema):
     records_dir = tmp_path / "records"
     artifacts_dir = tmp_path / "incidents"
     snapshot = {"runtime": {"mode": "strict"}, "sources": {"version": 1}}
@@ -260,7 +257,6 @@ def test_cmd_incidents_replay_emits_run_record(monkeypatch, tmp_path: Path):
     files = sorted(records_dir.glob("*.json"))
     assert len(files) >= 2  # baseline + replay
     replay_record = json.loads(files[-1].read_text(encoding="utf-8"))
-    schema = json.loads(Path("docs/specs/run-record.schema.json").read_text(encoding="utf-8"))
-    jsonschema.validate(instance=replay_record, schema=schema)
+    jsonschema.validate(instance=replay_record, schema=run_record_schema)
     assert replay_record["operator_id"] == "hardstop.incidents.replay@1.0.0"
     assert replay_record["config_hash"] == fingerprint_config(snapshot)
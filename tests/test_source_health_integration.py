@@ -963,6 +963,7 @@ def test_batch_failure_preflight_writes_source_run_failure_before_reraise(sessio
     assert our_run.error is not None, "Batch-level failures should set error field"
     assert "preflight" in our_run.error.lower() or "batch-level" in our_run.error.lower(), \
         f"Error should contain injected marker, got: {our_run.error}"
+    assert our_run.error.startswith("RuntimeError: "), "Error should be prefixed with the exception type"
     # Note: items_processed may be 0, but we don't assert it as invariant since counter increments
     # could be moved above preflight in future refactors
     assert our_run.duration_seconds is not None
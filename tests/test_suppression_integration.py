@@ -214,3 +214,73 @@ def test_explain_suppress_logs_decisions(session: Session, caplog):
     item = session.query(RawItem).filter(RawItem.raw_id == raw_item.raw_id).first()
     assert item.suppression_primary_rule_id == "test_rule"
 
+
+def test_empty_rules_skip_suppression_evaluation(session: Session, mocker, ingest_output_dirs):
+    """Test that ingest skips evaluate_suppression when no rules are configured."""
+    mocker.patch(
+        "hardstop.runners.ingest_external.load_sources_config",
+        return_value={"defaults": {}, "tiers": {}},
+    )
+    mocker.patch("hardstop.runners.ingest_external.get_all_sources", return_value=[])
+    mocker.patch(
+        "hardstop.runners.ingest_external.load_suppression_config",
+        return_value={"enabled": True, "rules": []},
+    )
+    evaluate = mocker.patch("hardstop.runners.ingest_external.evaluate_suppression")
+    
+    save_raw_item(
+        session,
+        source_id="test_source",
+        tier="global",
+        candidate={
+            "canonical_id": "test-no-rules",
+            "title": "Test Alert",
+            "payload": {"title": "Test Alert"},
+        },
+    )
+    session.commit()
+    
+    stats = ingest_external_main(session=session, source_id="test_source")
+    
+    evaluate.assert_not_called()
+    assert stats["suppressed"] == 0
+    assert stats["events"] == 1
+    records_dir, _ = ingest_output_dirs
+    assert list(records_dir.glob("*.json")), "run record should be written under tmp_path"
+
+
+def test_no_suppress_skips_rule_loading_and_evaluation(session: Session, mocker, ingest_output_dirs):
+    """Test that no_suppress=True never loads, parses, or evaluates suppression rules."""
+    mocker.patch(
+        "hardstop.runners.ingest_external.load_sources_config",
+        return_value={"defaults": {}, "tiers": {}},
+    )
+    mocker.patch(
+        "hardstop.runners.ingest_external.get_all_sources",
+        return_value=[{"id": "test_source", "suppress": [{"id": "r1", "kind": "keyword", "field": "title", "pattern": "Test"}]}],
+    )
+    load_config = mocker.patch("hardstop.runners.ingest_external.load_suppression_config")
+    parse_rules = mocker.patch("hardstop.runners.ingest_external._parse_source_rules")
+    evaluate = mocker.patch("hardstop.runners.ingest_external.evaluate_suppression")
+    
+    save_raw_item(
+        session,
+        source_id="test_source",
+        tier="global",
+        candidate={
+            "canonical_id": "test-no-suppress",
+            "title": "Test Alert",
+            "payload": {"title": "Test Alert"},
+        },
+    )
+    session.commit()
+    
+    stats = ingest_external_main(session=session, source_id="test_source", no_suppress=True)
+    
+    load_config.assert_not_called()
+    parse_rules.assert_not_called()
+    evaluate.assert_not_called()
+    assert stats["suppressed"] == 0
+    assert stats["alerts"] == 1
+    _, incidents_dir = ingest_output_dirs
+    assert list(incidents_dir.glob("*.json")), "incident artifact should be written under tmp_path"